@@ -0,0 +1,164 @@
+"""Render several variants of V (theme x narration x cut) in one go.
+
+    python batch.py --themes default warm --voices en=voices es=voices-es --cuts clean branded -q l -j 4
+
+Each variant renders into its own partial movie and Text directories.
+Segments, Text outlines and decoded narration are shared through a size-capped
+CacheStore, and a variant copies a segment in from the store instead of
+rendering it again. Narration only changes the audio track, so variants that
+differ just by language reuse every segment of the first one and only pay for
+the final concat + audio mix.
+
+The store lives in media/variants/cache unless --cache-dir points it
+somewhere else, e.g. a directory shared by several machines.
+"""
+import argparse
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from manim import logger, tempconfig
+
+from cache_store import CacheStore, file_digest
+from v import THEMES, V
+
+QUALITIES = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+NARRATION = "voice-variables-{:02d}"
+
+
+def decode_narration(args):
+    # mp3 -> wav once, named by the mp3's content so a re-recorded track is decoded again
+    src, audio_dir, cache_dir, cache_size = args
+    key = f"{file_digest(src)}.wav"
+    dst = os.path.join(audio_dir, key)
+    if os.path.exists(dst):
+        return dst
+    # Cache errors only cost a decode, they never stop the batch
+    try:
+        store = CacheStore(cache_dir, cache_size)
+        if store.get("audio", key, dst):
+            return dst
+    except OSError as e:
+        logger.warning(f"Could not read render cache {cache_dir}: {e}")
+        store = None
+
+    from pydub import AudioSegment
+
+    tmp = f"{dst}.{os.getpid()}.tmp"
+    AudioSegment.from_file(src).export(tmp, format="wav")
+    os.replace(tmp, dst)
+    if store:
+        try:
+            store.put("audio", key, dst)
+        except OSError as e:
+            logger.warning(f"Could not publish to render cache {cache_dir}: {e}")
+    return dst
+
+
+def render_variant(variant):
+    with tempconfig({
+        "quality": variant["quality"],
+        "media_dir": variant["media_dir"],
+        "partial_movie_dir": variant["partial_movie_dir"],
+        "text_dir": variant["text_dir"],
+        "max_files_cached": variant["max_files_cached"],
+        "output_file": variant["name"],
+        "progress_bar": "none",
+    }):
+        scene = type("V", (V,), {
+            "theme": variant["theme"],
+            "narration": variant["narration"],
+            "branded": variant["branded"],
+            "cache_dir": variant["cache_dir"],
+            "cache_size": variant["cache_size"],
+        })()
+        scene.render()
+    return variant["name"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--themes", nargs="+", default=["default"], choices=sorted(THEMES))
+    parser.add_argument("--voices", nargs="+", default=["voices"],
+                        help="narration directories, one per language, as LANG=DIR or just DIR")
+    parser.add_argument("--cuts", nargs="+", default=["clean"], choices=["clean", "branded"])
+    parser.add_argument("-q", "--quality", default="h", choices=sorted(QUALITIES))
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count())
+    parser.add_argument("--media-dir", default="media")
+    parser.add_argument("--max-files-cached", type=int, default=2000)
+    parser.add_argument("--cache-dir", help="CacheStore root, may be shared between machines (default: <media-dir>/variants/cache)")
+    parser.add_argument("--cache-size", type=float, default=20, help="CacheStore size cap in GiB")
+    args = parser.parse_args()
+    cache_size = int(args.cache_size * 2**30)
+
+    # Language label -> narration directory; labels name the outputs, so they must differ
+    languages = {}
+    for voices in args.voices:
+        lang, _, path = voices.rpartition("=")
+        lang = lang or os.path.basename(os.path.normpath(path))
+        if lang in languages:
+            parser.error(f"narration label {lang!r} is used twice, pass LANG=DIR to tell them apart")
+        languages[lang] = path
+
+    root = os.path.join(args.media_dir, "variants")
+    cache_dir = args.cache_dir or os.path.join(root, "cache")
+    audio_dir = os.path.join(root, "audio")
+    os.makedirs(audio_dir, exist_ok=True)
+
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        # Decode every narration track once, up front
+        narration = {}
+        for lang, path in languages.items():
+            tracks = [os.path.join(path, f"{NARRATION.format(i)}.mp3") for i in range(1, 8)]
+            wavs = list(pool.map(decode_narration, [(track, audio_dir, cache_dir, cache_size) for track in tracks]))
+            # V formats the template with the track number, so give each language its own links
+            lang_dir = os.path.join(audio_dir, lang)
+            os.makedirs(lang_dir, exist_ok=True)
+            for i, wav in enumerate(wavs, start=1):
+                link = os.path.join(lang_dir, f"{NARRATION.format(i)}.wav")
+                if os.path.lexists(link):
+                    os.remove(link)
+                os.symlink(os.path.relpath(wav, lang_dir), link)
+            narration[lang] = os.path.join(lang_dir, f"{NARRATION}.wav")
+
+        variants = []
+        for theme, lang, cut in itertools.product(args.themes, languages, args.cuts):
+            name = f"V-{theme}-{lang}-{cut}"
+            variants.append({
+                "name": name,
+                "theme": theme,
+                "narration": narration[lang],
+                "branded": cut == "branded",
+                "quality": QUALITIES[args.quality],
+                "media_dir": args.media_dir,
+                # Never shared between concurrent renders: the SceneFileWriter writes its
+                # concat list and prunes in here, and Text writes its svgs non-atomically
+                "partial_movie_dir": os.path.join(root, "partial_movie_files", name),
+                "text_dir": os.path.join(root, "texts", name),
+                "max_files_cached": args.max_files_cached,
+                "cache_dir": cache_dir,
+                "cache_size": cache_size,
+            })
+
+        # Frames only depend on theme and cut. Render one variant per look first,
+        # then the rest, which find all their segments in the store.
+        first, rest, seen = [], [], set()
+        for variant in variants:
+            look = (variant["theme"], variant["branded"])
+            (rest if look in seen else first).append(variant)
+            seen.add(look)
+
+        for wave in (first, rest):
+            for name in pool.map(render_variant, wave):
+                print(f"Rendered {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""Content-addressed cache for rendered segments, text outlines and decoded audio.
+
+Layout under the store root (a local directory or a mount shared by several
+render machines):
+
+    objects/ab/abcdef...   blobs, named by the sha256 of their content
+    refs/<kind>/<key>      sha256 of the blob stored under that key
+    tmp/                   in-flight writes
+
+Every write goes to tmp/ first and is os.replace()d into place, so concurrent
+workers only ever see complete files. Reads re-hash the blob and drop it if it
+doesn't match its name. Hits bump the blob's mtime, and evict() deletes the
+least recently used blobs once the store is over max_bytes. A ref whose blob
+was evicted is just a miss and gets removed on the next get().
+"""
+import hashlib
+import os
+import shutil
+import tempfile
+import time
+
+
+def file_digest(path):
+    sha = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _atomic_copy(src, dst, tmp_dir):
+    os.makedirs(os.path.dirname(dst) or ".", exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=tmp_dir)
+    try:
+        with os.fdopen(fd, "wb") as out, open(src, "rb") as f:
+            shutil.copyfileobj(f, out)
+            out.flush()
+            os.fsync(out.fileno())
+        os.replace(tmp, dst)
+    except BaseException:
+        _remove(tmp)
+        raise
+
+
+class CacheStore:
+    def __init__(self, root, max_bytes):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.tmp_dir = os.path.join(root, "tmp")
+        for name in ("objects", "refs", "tmp"):
+            os.makedirs(os.path.join(root, name), exist_ok=True)
+
+    def _object(self, digest):
+        return os.path.join(self.root, "objects", digest[:2], digest)
+
+    def _ref(self, kind, key):
+        return os.path.join(self.root, "refs", kind, key)
+
+    def has(self, kind, key):
+        # The ref alone isn't enough: its blob may have been evicted since
+        try:
+            with open(self._ref(kind, key)) as f:
+                return os.path.exists(self._object(f.read().strip()))
+        except FileNotFoundError:
+            return False
+
+    def keys(self, kind):
+        try:
+            return sorted(os.listdir(os.path.join(self.root, "refs", kind)))
+        except FileNotFoundError:
+            return []
+
+    def put(self, kind, key, path):
+        digest = file_digest(path)
+        obj = self._object(digest)
+        try:
+            os.utime(obj)
+        except FileNotFoundError:
+            # Not stored yet, or evicted by another worker just now
+            _atomic_copy(path, obj, self.tmp_dir)
+
+        fd, tmp = tempfile.mkstemp(dir=self.tmp_dir)
+        with os.fdopen(fd, "w") as f:
+            f.write(digest)
+        os.makedirs(os.path.dirname(self._ref(kind, key)), exist_ok=True)
+        os.replace(tmp, self._ref(kind, key))
+        return digest
+
+    def get(self, kind, key, dest):
+        # Copy the blob stored under `key` to `dest`; False on a miss
+        ref = self._ref(kind, key)
+        try:
+            with open(ref) as f:
+                digest = f.read().strip()
+            obj = self._object(digest)
+            if file_digest(obj) != digest:
+                # Corrupt blob, e.g. a partial copy on a flaky mount
+                _remove(obj)
+                _remove(ref)
+                return False
+            _atomic_copy(obj, dest, os.path.dirname(dest) or ".")
+            os.utime(obj)
+        except FileNotFoundError:
+            # Never stored, or evicted by another worker in the meantime
+            _remove(ref)
+            return False
+        return True
+
+    def evict(self):
+        # Drop least recently used blobs until the store fits in max_bytes
+        blobs, total = [], 0
+        for dirpath, _, files in os.walk(os.path.join(self.root, "objects")):
+            for name in files:
+                path = os.path.join(dirpath, name)
+                try:
+                    st = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                blobs.append((st.st_mtime, st.st_size, path))
+                total += st.st_size
+        for _, size, path in sorted(blobs):
+            if total <= self.max_bytes:
+                break
+            _remove(path)
+            total -= size
+
+        # Leftovers of writers that died mid-copy
+        for name in os.listdir(self.tmp_dir):
+            path = os.path.join(self.tmp_dir, name)
+            try:
+                if os.stat(path).st_mtime < time.time() - 3600:
+                    _remove(path)
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,99 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from cache_store import CacheStore, file_digest
+
+
+def write(path, data):
+    with open(path, "wb") as f:
+        f.write(data)
+    return str(path)
+
+
+def put_same_key(args):
+    root, src, dest = args
+    store = CacheStore(root, 10**6)
+    store.put("texts", "outline.svg", src)
+    return store.get("texts", "outline.svg", dest)
+
+
+def test_put_get_roundtrip(tmp_path):
+    store = CacheStore(str(tmp_path / "store"), 10**6)
+    src = write(tmp_path / "segment.mp4", b"frames" * 100)
+
+    digest = store.put("segments", "abc", src)
+
+    assert digest == file_digest(src)
+    assert store.has("segments", "abc")
+    assert store.keys("segments") == ["abc"]
+    assert store.get("segments", "abc", str(tmp_path / "out" / "abc.mp4"))
+    assert (tmp_path / "out" / "abc.mp4").read_bytes() == b"frames" * 100
+
+
+def test_get_miss(tmp_path):
+    store = CacheStore(str(tmp_path / "store"), 10**6)
+
+    assert not store.has("segments", "nope")
+    assert not store.get("segments", "nope", str(tmp_path / "out"))
+    assert not (tmp_path / "out").exists()
+
+
+def test_evict_drops_least_recently_used_down_to_max_bytes(tmp_path):
+    store = CacheStore(str(tmp_path / "store"), 2500)
+    for i, key in enumerate("ABCD"):
+        src = write(tmp_path / key, key.encode() * 1000)
+        store.put("segments", key, src)
+        obj = store._object(file_digest(src))
+        os.utime(obj, (1000 + i, 1000 + i))
+    # A hit makes A the most recently used
+    store.get("segments", "A", str(tmp_path / "hit"))
+
+    store.evict()
+
+    assert [k for k in "ABCD" if store.has("segments", k)] == ["A", "D"]
+    sizes = [os.path.getsize(os.path.join(d, f))
+             for d, _, files in os.walk(tmp_path / "store" / "objects") for f in files]
+    assert sum(sizes) <= 2500
+
+
+def test_has_is_false_after_blob_evicted(tmp_path):
+    store = CacheStore(str(tmp_path / "store"), 0)
+    src = write(tmp_path / "A", b"A" * 1000)
+    store.put("segments", "A", src)
+
+    store.evict()
+
+    assert not store.has("segments", "A")
+    assert not store.get("segments", "A", str(tmp_path / "out"))
+    # ... so it gets published again
+    store.max_bytes = 10**6
+    store.put("segments", "A", src)
+    assert store.has("segments", "A")
+
+
+def test_get_drops_corrupt_blob_and_ref(tmp_path):
+    store = CacheStore(str(tmp_path / "store"), 10**6)
+    digest = store.put("segments", "A", write(tmp_path / "A", b"A" * 1000))
+    write(store._object(digest), b"truncated")
+
+    assert not store.get("segments", "A", str(tmp_path / "out"))
+    assert not os.path.exists(store._object(digest))
+    assert not os.path.exists(store._ref("segments", "A"))
+    assert not (tmp_path / "out").exists()
+
+
+def test_concurrent_put_of_same_key(tmp_path):
+    root = str(tmp_path / "store")
+    jobs = []
+    for i in range(16):
+        src = write(tmp_path / f"src{i}", b"outline" * 500)
+        jobs.append((root, src, str(tmp_path / "out" / f"{i}.svg")))
+
+    with ProcessPoolExecutor(4) as pool:
+        assert all(pool.map(put_same_key, jobs))
+
+    store = CacheStore(root, 10**6)
+    assert store.keys("texts") == ["outline.svg"]
+    assert os.listdir(os.path.join(root, "tmp")) == []
+    for i in range(16):
+        assert (tmp_path / "out" / f"{i}.svg").read_bytes() == b"outline" * 500
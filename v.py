@@ -1,5 +1,10 @@
+import os
+from functools import lru_cache
+
 from manim import *
 
+from cache_store import CacheStore
+
 # PART 3
 # Your computer’s memory can be broadly divided into two regions – the stack and the heap. The stack is used for fixed-size, short-lived data like local variables inside a function. It works like a stack of plates, where new items are placed on top and removed from the top. The heap, on the other hand, is used for dynamic, flexible data like objects, arrays, or anything that doesn’t have a fixed size at compile time. The stack is fast but limited in size, while the heap is larger but a little slower to access. So when you create a variable, depending on its type and the language you’re using, it may live in the stack or in the heap.
 
@@ -21,29 +26,192 @@ from manim import *
 # PART 9
 # If you truly understand variables, you begin to see them not just as names, but as connections between human-readable code and the computer’s raw memory. And that understanding will give you a much deeper grasp of how programs actually work under the hood.
 
+# Color themes for the PART backgrounds (bg ... bg7) and the stack / heap accents
+THEMES = {
+    "default": {
+        "bg": [BLUE_E, TEAL_D],
+        "bg2": [PURPLE_E, BLUE_E, TEAL_D],
+        "bg3": [BLACK, BLUE_E, GREY_E],
+        "bg4": [BLACK, PURPLE_E, BLUE_E],
+        "bg5": [BLACK, BLUE_D, TEAL_D],
+        "bg6": [BLACK, BLUE_D, TEAL_E],
+        "bg7": [BLACK, BLUE_E, TEAL_D],
+        "stack": YELLOW_B,
+        "heap": TEAL_A,
+    },
+    "warm": {
+        "bg": [MAROON_E, RED_D],
+        "bg2": [PURPLE_E, MAROON_E, RED_D],
+        "bg3": [BLACK, MAROON_E, GREY_E],
+        "bg4": [BLACK, PURPLE_E, MAROON_E],
+        "bg5": [BLACK, RED_E, ORANGE],
+        "bg6": [BLACK, MAROON_D, RED_E],
+        "bg7": [BLACK, MAROON_E, RED_D],
+        "stack": GOLD_B,
+        "heap": ORANGE,
+    },
+    "mono": {
+        "bg": [GREY_E, GREY_C],
+        "bg2": [BLACK, GREY_E, GREY_C],
+        "bg3": [BLACK, GREY_E, GREY_D],
+        "bg4": [BLACK, GREY_D, GREY_E],
+        "bg5": [BLACK, GREY_E, GREY_D],
+        "bg6": [BLACK, GREY_E, GREY_C],
+        "bg7": [BLACK, GREY_E, GREY_C],
+        "stack": YELLOW_B,
+        "heap": GREY_A,
+    },
+}
+
+
+def lod_circle(radius, max_scale=1, tolerance=0.1, **kwargs):
+    # Circle with as few cubic pieces as the output resolution needs: a piece
+    # spanning angle a strays at most r * 2/27 * sin(a/4)^6 / cos(a/4)^2 from the
+    # true circle, so keep that under `tolerance` pixels at the largest on-screen
+    # size the circle reaches (max_scale) instead of always using 8 pieces
+    radius_px = radius * max_scale * config.pixel_width / config.frame_width
+    pieces = 4
+    while radius_px * 2 / 27 * np.sin(TAU / pieces / 4) ** 6 / np.cos(TAU / pieces / 4) ** 2 > tolerance:
+        pieces += 1
+    return Circle(radius, num_components=pieces + 1, **kwargs)
+
+
+@lru_cache(maxsize=None)
+def flash_rays(num_lines, flash_radius, line_length):
+    # Start and end of every Flash ray around the origin, shared by all flashes of that size
+    angles = np.arange(0, TAU, TAU / num_lines)
+    directions = np.stack([np.cos(angles), np.sin(angles), np.zeros_like(angles)], axis=1)
+    return directions * flash_radius, directions * (flash_radius + line_length)
+
+
+class Flashes(Animation):
+    # Flash on one or more targets in a single animation: the rays of every
+    # target live in one VMobject and each frame cuts them all in one numpy pass
+    def __init__(self, *targets, color=YELLOW, flash_radius=0.1, line_length=0.2, num_lines=12,
+                 line_stroke_width=3, time_width=1, **kwargs):
+        starts, ends = flash_rays(num_lines, flash_radius, line_length)
+        centers = np.array([t.get_center() if isinstance(t, Mobject) else t for t in targets])
+        self.starts = (centers[:, None] + starts).reshape(-1, 3)
+        self.deltas = (centers[:, None] + ends).reshape(-1, 3) - self.starts
+        self.time_width = time_width
+        rays = VMobject(stroke_color=color, stroke_width=line_stroke_width)
+        super().__init__(rays, remover=True, introducer=True, **kwargs)
+
+    def interpolate_mobject(self, alpha):
+        # Same window as ShowPassingFlash; the visible part of a straight ray is a straight cubic
+        upper = interpolate(0, 1 + self.time_width, self.rate_func(alpha))
+        t = np.linspace(max(upper - self.time_width, 0), min(upper, 1), 4)
+        points = self.starts[:, None] + t[None, :, None] * self.deltas[:, None]
+        self.mobject.set_points(points.reshape(-1, 3))
+
+
+class Pulse(Animation):
+    # Indicate without building a scaled, recolored copy to transform into:
+    # scale about the fixed center and blend the colors toward `color` directly
+    def __init__(self, mobject, scale_factor=1.2, color=YELLOW, rate_func=there_and_back, **kwargs):
+        self.scale_factor = scale_factor
+        self.rgb = ManimColor(color).to_rgb()
+        super().__init__(mobject, rate_func=rate_func, **kwargs)
+
+    def begin(self):
+        self.center = self.mobject.get_center()
+        super().begin()
+
+    def interpolate_submobject(self, submobject, starting_submobject, alpha):
+        scale = interpolate(1, self.scale_factor, alpha)
+        submobject.points = self.center + scale * (starting_submobject.points - self.center)
+        for attr in ("fill_rgbas", "stroke_rgbas"):
+            rgbas = getattr(starting_submobject, attr).copy()
+            rgbas[:, :3] = interpolate(rgbas[:, :3], self.rgb, alpha)
+            setattr(submobject, attr, rgbas)
+
+
 class V(Scene):
+    # Variant knobs, overridden per render by batch.py
+    theme = "default"
+    narration = "voices/voice-variables-{:02d}.mp3"
+    branded = False
+    # Shared render cache (see cache_store.py), off for plain `manim v.py V` runs
+    cache_dir = None
+    cache_size = 20 * 2**30
+
+    def setup(self):
+        # Any cache I/O error (EIO, ESTALE, a full disk on the shared mount) is
+        # logged and treated as a miss, so the cache can never abort a render
+        self.store = None
+        if not self.cache_dir:
+            return
+        try:
+            self.store = CacheStore(self.cache_dir, self.cache_size)
+
+            # Text outlines are tiny, pull them all in before any Text is built
+            text_dir = config.get_dir("text_dir")
+            os.makedirs(text_dir, exist_ok=True)
+            for name in self.store.keys("texts"):
+                if not os.path.exists(os.path.join(text_dir, name)):
+                    self.store.get("texts", name, os.path.join(text_dir, name))
+        except OSError as e:
+            logger.warning(f"Could not read render cache {self.cache_dir}: {e}")
+            if self.store is None:
+                return
+
+        # Segments are fetched on demand: a local miss asks the store before rendering
+        writer = self.renderer.file_writer
+        is_already_cached = writer.is_already_cached
+
+        def fetch(hash_invocation):
+            if is_already_cached(hash_invocation):
+                return True
+            path = os.path.join(writer.partial_movie_directory, f"{hash_invocation}{config.movie_file_extension}")
+            try:
+                return self.store.get("segments", hash_invocation, path)
+            except OSError as e:
+                logger.warning(f"Could not read render cache {self.cache_dir}: {e}")
+                return False
+
+        writer.is_already_cached = fetch
+
+    def tear_down(self):
+        if not self.store:
+            return
+        # Publish whatever this render produced so no other worker renders it again.
+        # Best effort: the movie is combined after tear_down, a cache error must not lose it
+        try:
+            for path in self.renderer.file_writer.partial_movie_files:
+                key = os.path.splitext(os.path.basename(path))[0] if path else None
+                if key and not self.store.has("segments", key):
+                    self.store.put("segments", key, path)
+            text_dir = config.get_dir("text_dir")
+            for name in os.listdir(text_dir):
+                if not self.store.has("texts", name):
+                    self.store.put("texts", name, os.path.join(text_dir, name))
+            self.store.evict()
+        except OSError as e:
+            logger.warning(f"Could not publish to render cache {self.cache_dir}: {e}")
+
     def construct(self):
+        theme = THEMES[self.theme]
+
+        # Branded cut: watermark stays on top of everything for the whole video
+        if self.branded:
+            watermark = Text("manimations", font="Futura", color=WHITE).scale(0.35).set_opacity(0.6)
+            self.add_foreground_mobject(watermark.to_corner(DR, buff=0.3))
 
         # PART 1
         # "Let’s talk about one of the most fundamental concepts in programming – variables. At first glance, a variable might look like just a name that holds some value. For example, in Python, you write x = 10, and now x represents the number ten. But the truth is, a variable is much deeper than just a name and a value.
 
         # Narration
-        self.add_sound("voices/voice-variables-01.mp3", time_offset=0)
-        self.add_sound("voices/voice-variables-02.mp3", time_offset=47)
-        self.add_sound("voices/voice-variables-03.mp3", time_offset=98)
-        self.add_sound("voices/voice-variables-04.mp3", time_offset=125)
-        self.add_sound("voices/voice-variables-05.mp3", time_offset=152)
-        self.add_sound("voices/voice-variables-06.mp3", time_offset=182)
-        self.add_sound("voices/voice-variables-07.mp3", time_offset=215)
+        for i, offset in enumerate([0, 47, 98, 125, 152, 182, 215], start=1):
+            self.add_sound(self.narration.format(i), time_offset=offset)
 
         bg = Rectangle(width=16, height=9, stroke_width=0, fill_opacity=0.9)
-        bg.set_fill(color=color_gradient([BLUE_E, TEAL_D], 5), opacity=0.9)
+        bg.set_fill(color=color_gradient(theme["bg"], 5), opacity=0.9)
         self.add(bg)
 
         title = Text("The most fundamental concept\n in programming", weight=BOLD, font="Optima").scale(1.2).move_to(ORIGIN)
         self.play(TypeWithCursor(title, rate_func=linear, cursor=Rectangle(width=0.2, height=0.2).scale(1.2)) )
 
-        dot = RoundedRectangle(color=color_gradient([YELLOW_B, YELLOW_E, BLUE, TEAL], 5)[0], height=3.8,
+        dot = RoundedRectangle(color=color_gradient([theme["stack"], YELLOW_E, BLUE, TEAL], 5)[0], height=3.8,
                                width=5.5).move_to(ORIGIN)
         underline = Line(LEFT * 1, RIGHT * 1, color=GOLD).next_to(title, DOWN)
         title2 = Text("Variable", weight=NORMAL, font="Optima").scale(1.5).move_to(ORIGIN)
@@ -80,7 +248,7 @@ class V(Scene):
             FadeOut(title_down),
                 FadeOut(underline),
                 ReplacementTransform(title2, title3),
-                Transform(dot, Circle(2.5, YELLOW),
+                Transform(dot, lod_circle(2.5, color=YELLOW),
                     run_time=1.5, rate_func=smooth)
              ),
             run_time=2.5, rate_func=linear)
@@ -92,9 +260,9 @@ class V(Scene):
 
         # Create concentric layers (representing depth)
         layers = VGroup(
-            Circle(radius=2.8, color=BLUE_E, stroke_width=2),
-            Circle(radius=3.3, color=TEAL_D, stroke_width=2),
-            Circle(radius=3.8, color=PURPLE_B, stroke_width=2),
+            lod_circle(2.8, color=BLUE_E, stroke_width=2),
+            lod_circle(3.3, color=TEAL_D, stroke_width=2),
+            lod_circle(3.8, color=PURPLE_B, stroke_width=2),
         ).move_to(dot.get_center())
 
         # Animate transition: circle expands into layers
@@ -105,7 +273,7 @@ class V(Scene):
         self.play(LaggedStart(*[Create(layer) for layer in layers[1:]], lag_ratio=0.3), run_time=2)
 
         # Subtle glow effect
-        self.play(Flash(layers[-1], color=YELLOW, flash_radius=1.5), run_time=1.2)
+        self.play(Flashes(layers[-1], color=YELLOW, flash_radius=1.5), run_time=1.2)
 
         self.wait(1)
 
@@ -142,7 +310,7 @@ class V(Scene):
 
         # Highlight memory cell
         self.play(target_cell.animate.set_fill(YELLOW, opacity=0.6))
-        self.play(Indicate(target_cell, color=TEAL_B))
+        self.play(Pulse(target_cell, color=TEAL_B))
 
         # Show value "10" appearing in memory
         mem_value = Text("10", font="Futura").scale(0.6).move_to(target_cell.get_center())
@@ -182,11 +350,11 @@ class V(Scene):
 
         # Background shift for dramatic effect
         bg2 = Rectangle(width=16, height=9, stroke_width=0)
-        bg2.set_fill(color=color_gradient([PURPLE_E, BLUE_E, TEAL_D], 7), opacity=0.85)
+        bg2.set_fill(color=color_gradient(theme["bg2"], 7), opacity=0.85)
         self.play(FadeIn(bg2), run_time=1.5)
 
         # Titles for Stack & Heap
-        stack_title = Text("STACK", weight=BOLD, color=YELLOW_B, font="Optima").scale(0.9).to_edge(UL, buff=1)
+        stack_title = Text("STACK", weight=BOLD, color=theme["stack"], font="Optima").scale(0.9).to_edge(UL, buff=1)
         heap_title = Text("HEAP", weight=BOLD, color=TEAL_B, font="Optima").scale(0.9).to_edge(UR, buff=1)
 
         self.play(Write(stack_title), Write(heap_title), run_time=1.5)
@@ -209,7 +377,7 @@ class V(Scene):
 
         # Decorative glowing borders
         stack_border = SurroundingRectangle(stack_region, color=YELLOW, buff=0.2, stroke_width=2)
-        heap_border = SurroundingRectangle(heap_region, color=TEAL_A, buff=0.2, stroke_width=2)
+        heap_border = SurroundingRectangle(heap_region, color=theme["heap"], buff=0.2, stroke_width=2)
         self.play(Create(stack_border), Create(heap_border))
 
         # --- Text Explanations ---
@@ -224,7 +392,7 @@ class V(Scene):
 
 
         # --- Stack as plates ---
-        plate1 = Rectangle(width=1, height=0.5, color=YELLOW_B, fill_opacity=0.8).next_to(stack_region, ORIGIN * 0.5, buff=0.5)
+        plate1 = Rectangle(width=1, height=0.5, color=theme["stack"], fill_opacity=0.8).next_to(stack_region, ORIGIN * 0.5, buff=0.5)
         plate2 = plate1.copy().next_to(plate1, UP, buff=0)
         plate3 = plate1.copy().next_to(plate2, UP, buff=0)
 
@@ -233,9 +401,9 @@ class V(Scene):
         self.play(FadeIn(plate3, shift=UP), run_time=1.8)
 
         # Highlight stack order (Last In First Out)
-        self.play(Indicate(plate3, color=YELLOW_E), run_time=2)
+        self.play(Pulse(plate3, color=YELLOW_E), run_time=2)
         self.play(FadeOut(plate3, shift=UP), run_time=1.8)
-        self.play(Indicate(plate2, color=YELLOW_E), run_time=2)
+        self.play(Pulse(plate2, color=YELLOW_E), run_time=2)
 
         heap_text = Text(
             "\nObjects\nArrays\nDynamic data",
@@ -259,7 +427,7 @@ class V(Scene):
         self.play(GrowFromCenter(obj3), run_time=1.8)
 
         # Glow effect on heap allocation
-        self.play(Flash(obj2, color=TEAL, flash_radius=1.2), run_time=1)
+        self.play(Flashes(obj2, color=TEAL, flash_radius=1.2), run_time=1)
 
         # --- Subtitle ---
         subtitle2 = Text(
@@ -304,7 +472,7 @@ class V(Scene):
         # === PART 3 ===
         # Background reset
         bg3 = Rectangle(width=16, height=9, stroke_width=0)
-        bg3.set_fill(color=color_gradient([BLACK, BLUE_E, GREY_E], 6), opacity=0.9)
+        bg3.set_fill(color=color_gradient(theme["bg3"], 6), opacity=0.9)
         self.play(FadeIn(bg3), run_time=1.5)
 
         # Title
@@ -325,13 +493,13 @@ class V(Scene):
         stack_region_c = VGroup(*[Square(0.5, color=GREY, fill_opacity=0.35) for _ in range(12)])
         stack_region_c.arrange_in_grid(rows=3, cols=4, buff=0.1).to_edge(RIGHT, buff=2).shift(UP*2)
 
-        stack_border_c = SurroundingRectangle(stack_region_c, color=YELLOW_B, buff=0.2, stroke_width=2)
+        stack_border_c = SurroundingRectangle(stack_region_c, color=theme["stack"], buff=0.2, stroke_width=2)
 
         # Heap region (larger, bottom-right)
         heap_region_c = VGroup(*[Square(0.5, color=GREY, fill_opacity=0.35) for _ in range(16)])
         heap_region_c.arrange_in_grid(rows=4, cols=4, buff=0.1).to_edge(RIGHT, buff=2).shift(DOWN*1.5)
 
-        heap_border_c = SurroundingRectangle(heap_region_c, color=TEAL_A, buff=0.2, stroke_width=2)
+        heap_border_c = SurroundingRectangle(heap_region_c, color=theme["heap"], buff=0.2, stroke_width=2)
 
         self.play(Create(stack_region_c), Create(heap_region_c), Create(stack_border_c), Create(heap_border_c), run_time=2)
 
@@ -340,25 +508,25 @@ class V(Scene):
         x_text = Text("x:5", font="Futura", color=BLACK).scale(0.45).move_to(x_box.get_center())
         x_group = VGroup(x_box, x_text).move_to(stack_region_c[5].get_center())
 
-        self.play(Indicate(c_code[0], color=GREEN_C), run_time=1.5)
+        self.play(Pulse(c_code[0], color=GREEN_C), run_time=1.5)
         self.play(GrowFromCenter(x_group), run_time=2)
-        self.play(Flash(x_group, color=GREEN_C, flash_radius=0.8), run_time=1)
+        self.play(Flashes(x_group, color=GREEN_C, flash_radius=0.8), run_time=1)
 
         # Animate "malloc" → memory block in heap
         malloc_block = RoundedRectangle(corner_radius=0.15, width=1, height=0.7, fill_opacity=0.8, fill_color=TEAL_B)
         malloc_text = Text("p → ?", font="Futura", color=BLACK).scale(0.45).move_to(malloc_block.get_center())
         malloc_group = VGroup(malloc_block, malloc_text).move_to(heap_region_c[10].get_center())
 
-        self.play(Indicate(c_code[1], color=TEAL_B), run_time=1.5)
+        self.play(Pulse(c_code[1], color=TEAL_B), run_time=1.5)
         self.play(GrowFromCenter(malloc_group), run_time=2)
 
         # Show assignment "*p = 20;" → heap gets 20
         malloc_text_new = Text("p → 20", font="Futura", color=BLACK).scale(0.45).move_to(malloc_block.get_center())
-        self.play(Indicate(c_code[2], color=TEAL_B), run_time=1.5)
+        self.play(Pulse(c_code[2], color=TEAL_B), run_time=1.5)
         self.play(Transform(malloc_text, malloc_text_new), run_time=2)
 
         # Free(p) → fade out heap block
-        self.play(Indicate(c_code[3], color=RED), run_time=1.5)
+        self.play(Pulse(c_code[3], color=RED), run_time=1.5)
         self.play(FadeOut(malloc_group, shift=DOWN), run_time=2)
 
         # Subtitle
@@ -389,7 +557,7 @@ class V(Scene):
         # === PART 4 ===
         # Background reset for Java scene
         bg4 = Rectangle(width=16, height=9, stroke_width=0)
-        bg4.set_fill(color=color_gradient([BLACK, PURPLE_E, BLUE_E], 6), opacity=0.9)
+        bg4.set_fill(color=color_gradient(theme["bg4"], 6), opacity=0.9)
         self.play(FadeIn(bg4), run_time=1.5)
 
         # Title
@@ -408,11 +576,11 @@ class V(Scene):
         # Stack & Heap regions (similar to Part 2 & 3 for consistency)
         stack_region_j = VGroup(*[Square(0.5, color=GREY, fill_opacity=0.35) for _ in range(12)])
         stack_region_j.arrange_in_grid(rows=3, cols=6, buff=0.1).to_edge(RIGHT, buff=2).shift(UP*2)
-        stack_border_j = SurroundingRectangle(stack_region_j, color=YELLOW_B, buff=0.2, stroke_width=2)
+        stack_border_j = SurroundingRectangle(stack_region_j, color=theme["stack"], buff=0.2, stroke_width=2)
 
         heap_region_j = VGroup(*[Square(0.5, color=GREY, fill_opacity=0.35) for _ in range(18)])
         heap_region_j.arrange_in_grid(rows=4, cols=6, buff=0.1).to_edge(RIGHT, buff=2).shift(DOWN*1.5)
-        heap_border_j = SurroundingRectangle(heap_region_j, color=TEAL_A, buff=0.2, stroke_width=2)
+        heap_border_j = SurroundingRectangle(heap_region_j, color=theme["heap"], buff=0.2, stroke_width=2)
 
         self.play(Create(stack_region_j), Create(heap_region_j), Create(stack_border_j), Create(heap_border_j), run_time=2)
 
@@ -421,9 +589,9 @@ class V(Scene):
         x_text_j = Text("x:10", font="Futura", color=BLACK).scale(0.45).move_to(x_box_j.get_center())
         x_group_j = VGroup(x_box_j, x_text_j).move_to(stack_region_j[0].get_center())
 
-        self.play(Indicate(java_code[0], color=GREEN_C), run_time=1.5)
+        self.play(Pulse(java_code[0], color=GREEN_C), run_time=1.5)
         self.play(GrowFromCenter(x_group_j), run_time=2)
-        self.play(Flash(x_group_j, color=GREEN_C, flash_radius=0.8), run_time=1)
+        self.play(Flashes(x_group_j, color=GREEN_C, flash_radius=0.8), run_time=1)
 
         # --- String s = "Hello"; ---
         # Stack → reference, Heap → object
@@ -435,7 +603,7 @@ class V(Scene):
         s_heap_text = Text("\"Hello\"", font="Futura", color=BLACK).scale(0.45).move_to(s_heap_obj.get_center())
         s_heap_group = VGroup(s_heap_obj, s_heap_text).move_to(heap_region_j[1].get_center())
 
-        self.play(Indicate(java_code[1], color=BLUE_B), run_time=1.5)
+        self.play(Pulse(java_code[1], color=BLUE_B), run_time=1.5)
         self.play(GrowFromCenter(s_stack_group), GrowFromCenter(s_heap_group), run_time=2)
 
         # Reference arrow
@@ -451,14 +619,14 @@ class V(Scene):
         obj_heap_text = Text("MyClass{}", font="Futura", color=BLACK).scale(0.45).move_to(obj_heap_obj.get_center())
         obj_heap_group = VGroup(obj_heap_obj, obj_heap_text).move_to(heap_region_j[10].get_center())
 
-        self.play(Indicate(java_code[2], color=ORANGE), run_time=1.5)
+        self.play(Pulse(java_code[2], color=ORANGE), run_time=1.5)
         self.play(GrowFromCenter(obj_stack_group), GrowFromCenter(obj_heap_group), run_time=2)
 
         arrow_obj = Arrow(obj_stack_group.get_bottom(), obj_heap_group.get_top(), buff=0.1, color=WHITE)
         self.play(Create(arrow_obj), run_time=1)
 
         # Glow both reference arrows for emphasis
-        self.play(Flash(arrow_s, color=YELLOW, flash_radius=1.2), Flash(arrow_obj, color=YELLOW, flash_radius=1.2), run_time=1)
+        self.play(Flashes(arrow_s, arrow_obj, color=YELLOW, flash_radius=1.2), run_time=1)
 
         # Subtitle explanation
         subtitle4 = Text(
@@ -490,7 +658,7 @@ class V(Scene):
 
         # Background reset for Python scene
         bg5 = Rectangle(width=16, height=9, stroke_width=0)
-        bg5.set_fill(color=color_gradient([BLACK, BLUE_D, TEAL_D], 6), opacity=0.9)
+        bg5.set_fill(color=color_gradient(theme["bg5"], 6), opacity=0.9)
         self.play(FadeIn(bg5), run_time=1.5)
 
         # Title
@@ -510,11 +678,11 @@ class V(Scene):
         # Python: show Stack as just references, Heap for everything
         stack_region_p = VGroup(*[Square(0.5, color=GREY, fill_opacity=0.35) for _ in range(8)])
         stack_region_p.arrange_in_grid(rows=2, cols=4, buff=0.1).to_edge(RIGHT, buff=2).shift(UP * 2)
-        stack_border_p = SurroundingRectangle(stack_region_p, color=YELLOW_B, buff=0.2, stroke_width=2)
+        stack_border_p = SurroundingRectangle(stack_region_p, color=theme["stack"], buff=0.2, stroke_width=2)
 
         heap_region_p = VGroup(*[Square(0.5, color=GREY, fill_opacity=0.35) for _ in range(20)])
         heap_region_p.arrange_in_grid(rows=5, cols=4, buff=0.1).to_edge(RIGHT, buff=2).shift(DOWN * 1.5)
-        heap_border_p = SurroundingRectangle(heap_region_p, color=TEAL_A, buff=0.2, stroke_width=2)
+        heap_border_p = SurroundingRectangle(heap_region_p, color=theme["heap"], buff=0.2, stroke_width=2)
 
         self.play(Create(stack_region_p), Create(heap_region_p), Create(stack_border_p), Create(heap_border_p), run_time=2)
 
@@ -527,7 +695,7 @@ class V(Scene):
         obj_x_text = Text("10 (int)", font="Futura", color=BLACK).scale(0.45).move_to(obj_x_heap.get_center())
         obj_x_group = VGroup(obj_x_heap, obj_x_text).move_to(heap_region_p[0].get_center())
 
-        self.play(Indicate(python_code[0], color=YELLOW_B), run_time=1.5)
+        self.play(Pulse(python_code[0], color=theme["stack"]), run_time=1.5)
         self.play(GrowFromCenter(x_group_p), GrowFromCenter(obj_x_group), run_time=2)
 
         arrow_x = Arrow(x_group_p.get_bottom(), obj_x_group.get_top(), buff=0.1, color=WHITE)
@@ -542,7 +710,7 @@ class V(Scene):
         obj_s_text = Text("\"Hello\"", font="Futura", color=BLACK).scale(0.45).move_to(obj_s_heap.get_center())
         obj_s_group = VGroup(obj_s_heap, obj_s_text).move_to(heap_region_p[6].get_center())
 
-        self.play(Indicate(python_code[1], color=BLUE_B), run_time=1.5)
+        self.play(Pulse(python_code[1], color=BLUE_B), run_time=1.5)
         self.play(GrowFromCenter(s_group_p), GrowFromCenter(obj_s_group), run_time=2)
 
         arrow_s_p = Arrow(s_group_p.get_bottom(), obj_s_group.get_top(), buff=0.1, color=WHITE)
@@ -557,19 +725,14 @@ class V(Scene):
         obj_arr_text = Text("[1,2,3]", font="Futura", color=BLACK).scale(0.45).move_to(obj_arr_heap.get_center())
         obj_arr_group = VGroup(obj_arr_heap, obj_arr_text).move_to(heap_region_p[12].get_center())
 
-        self.play(Indicate(python_code[2], color=ORANGE), run_time=1.5)
+        self.play(Pulse(python_code[2], color=ORANGE), run_time=1.5)
         self.play(GrowFromCenter(arr_group_p), GrowFromCenter(obj_arr_group), run_time=2)
 
         arrow_arr = Arrow(arr_group_p.get_bottom(), obj_arr_group.get_top(), buff=0.1, color=WHITE)
         self.play(Create(arrow_arr), run_time=1)
 
         # Glow arrows simultaneously
-        self.play(
-            Flash(arrow_x, color=YELLOW, flash_radius=1.2),
-            Flash(arrow_s_p, color=YELLOW, flash_radius=1.2),
-            Flash(arrow_arr, color=YELLOW, flash_radius=1.2),
-            run_time=1.5
-        )
+        self.play(Flashes(arrow_x, arrow_s_p, arrow_arr, color=YELLOW, flash_radius=1.2), run_time=1.5)
 
         # Subtitle explanation
         subtitle5 = Text(
@@ -601,7 +764,7 @@ class V(Scene):
         # Narration already queued above
 
         bg6 = Rectangle(width=16, height=9, stroke_width=0)
-        bg6.set_fill(color=color_gradient([BLACK, BLUE_D, TEAL_E], 7), opacity=0.9)
+        bg6.set_fill(color=color_gradient(theme["bg6"], 7), opacity=0.9)
         self.play(FadeIn(bg6), run_time=1.5)
 
         # Title
@@ -625,7 +788,7 @@ class V(Scene):
 
         heap_js = VGroup(*[Square(0.5, color=GREY, fill_opacity=0.35) for _ in range(16)])
         heap_js.arrange_in_grid(rows=4, cols=4, buff=0.1).to_edge(RIGHT, buff=2).shift(DOWN * 1.5)
-        heap_border_js = SurroundingRectangle(heap_js, color=TEAL_A, buff=0.2, stroke_width=2)
+        heap_border_js = SurroundingRectangle(heap_js, color=theme["heap"], buff=0.2, stroke_width=2)
 
         self.play(Create(exec_stack), Create(heap_js), Create(stack_border_js), Create(heap_border_js), run_time=2)
 
@@ -636,7 +799,7 @@ class V(Scene):
         a_text = Text("a:10", font="Futura", color=BLACK).scale(0.45).move_to(a_stack.get_center())
         a_group = VGroup(a_stack, a_text).move_to(exec_stack[0].get_center())
 
-        self.play(Indicate(js_code[0], color=YELLOW_B), GrowFromCenter(a_group), run_time=2)
+        self.play(Pulse(js_code[0], color=theme["stack"]), GrowFromCenter(a_group), run_time=2)
 
         self.wait(1)
 
@@ -645,7 +808,7 @@ class V(Scene):
         b_text = Text("b:20", font="Futura", color=BLACK).scale(0.45).move_to(b_stack.get_center())
         b_group = VGroup(b_stack, b_text).move_to(exec_stack[2].get_center())
 
-        self.play(Indicate(js_code[1], color=BLUE_B), GrowFromCenter(b_group), run_time=2)
+        self.play(Pulse(js_code[1], color=BLUE_B), GrowFromCenter(b_group), run_time=2)
 
         self.wait(1)
 
@@ -654,7 +817,7 @@ class V(Scene):
         c_text = Text("c:30 (const)", font="Futura", color=BLACK).scale(0.4).move_to(c_stack.get_center())
         c_group = VGroup(c_stack, c_text).move_to(exec_stack[8].get_center())
 
-        self.play(Indicate(js_code[2], color=PURPLE_B), GrowFromCenter(c_group), run_time=2)
+        self.play(Pulse(js_code[2], color=PURPLE_B), GrowFromCenter(c_group), run_time=2)
 
         self.wait(3)
 
@@ -663,7 +826,7 @@ class V(Scene):
         foo_text = Text("foo()", font="Futura", color=BLACK).scale(0.45).move_to(foo_context.get_center())
         foo_group = VGroup(foo_context, foo_text).move_to(exec_stack[12].get_center())
 
-        self.play(Indicate(js_code[3], color=TEAL_B), GrowFromCenter(foo_group), run_time=2)
+        self.play(Pulse(js_code[3], color=TEAL_B), GrowFromCenter(foo_group), run_time=2)
 
         # Animate closure (extra heap object for function)
         closure_obj = RoundedRectangle(corner_radius=0.15, width=1.75, height=0.8, fill_opacity=0.85, fill_color=TEAL_B)
@@ -702,7 +865,7 @@ class V(Scene):
 
         # Cinematic gradient background (dynamic, not static)
         bg7 = Rectangle(width=16, height=9, stroke_width=0)
-        bg7.set_fill(color_gradient([BLACK, BLUE_E, TEAL_D], 12), opacity=0.9)
+        bg7.set_fill(color_gradient(theme["bg7"], 12), opacity=0.9)
         self.play(FadeIn(bg7, scale=1.2), run_time=1)
 
         # Core text fade in with zoom glow
@@ -722,8 +885,9 @@ class V(Scene):
         self.play(Transform(core_text, core_text.copy().scale(0.55).move_to(ORIGIN)), run_time=2)
 
         # Central glowing orb (representing "Variable")
-        circle = Circle(radius=1.8, color=TEAL_A, stroke_width=8)
-        glow = circle.copy().set_stroke(width=0).set_fill(TEAL, opacity=0.4)
+        circle = lod_circle(1.8, max_scale=1.1, color=theme["heap"], stroke_width=8)
+        # Own pieces rather than circle.copy(): the glow fades in from 1.5x its size
+        glow = lod_circle(1.8, max_scale=1.5, stroke_width=0).set_fill(TEAL, opacity=0.4).move_to(circle)
 
         self.play(
             Create(circle, run_time=1),